@@ -1,7 +1,8 @@
+import asyncio
 import json
 import os
-import aiofiles
 from homeassistant import config_entries
+from homeassistant.util.json import json_loads
 import voluptuous as vol
 
 DOMAIN = "trasmatech_electricity"
@@ -11,17 +12,51 @@ CONF_API_URL = "api_url"
 CONF_TOKEN = "token"
 CONF_METER_ID = "meter_id"
 
-async def load_providers():
+# 🔹 The translation file never changes at runtime, so it is read, parsed and turned into
+# (providers, provider_names, data_schema, common_translations) only once
+_PROVIDERS_CACHE: tuple | None = None
+_PROVIDERS_LOCK = asyncio.Lock()
+
+def _build_providers(translations):
+    """Build the provider mappings and the user step schema from the translation data."""
+    providers_data = translations.get("config", {}).get("providers", {})
+    providers = {key: value["api_url"] for key, value in providers_data.items()}
+    provider_names = {key: value["name"] for key, value in providers_data.items()}
+
+    data_schema = None
+    if providers:
+        default_provider = next(iter(providers))
+        data_schema = vol.Schema(
+            {
+                vol.Required(CONF_PROVIDER, default=default_provider): vol.In(provider_names),
+                vol.Required(CONF_TOKEN): str,
+                vol.Required(CONF_METER_ID): vol.All(vol.Coerce(int), vol.Range(min=1)),
+            }
+        )
+
+    return providers, provider_names, data_schema, translations.get("common", {})
+
+async def load_providers(hass):
     """Load provider data asynchronously from the translation file."""
-    lang_path = os.path.join(os.path.dirname(__file__), "translations/en.json")
+    global _PROVIDERS_CACHE
+
+    async with _PROVIDERS_LOCK:
+        if _PROVIDERS_CACHE is not None:
+            return _PROVIDERS_CACHE
+
+        lang_path = os.path.join(os.path.dirname(__file__), "translations/en.json")
 
-    try:
-        async with aiofiles.open(lang_path, encoding="utf-8") as f:
-            content = await f.read()
-            translations = json.loads(content)
-        return translations.get("config", {}).get("providers", {}), translations.get("common", {})
-    except (FileNotFoundError, KeyError, json.JSONDecodeError):
-        return {}, {}
+        def _read():
+            with open(lang_path, encoding="utf-8") as f:
+                return f.read()
+
+        try:
+            content = await hass.async_add_executor_job(_read)
+            _PROVIDERS_CACHE = _build_providers(json_loads(content))
+        except (FileNotFoundError, KeyError, json.JSONDecodeError):
+            return {}, {}, None, {}
+
+        return _PROVIDERS_CACHE
 
 class TrasMaTechElectricityConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handles the configuration flow for the TrasMaTech Electricity integration."""
@@ -31,20 +66,9 @@ class TrasMaTechElectricityConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors = {}
 
         # 🔹 Load provider and common translation data from JSON file
-        providers_data, common_translations = await load_providers()
-
-        if not providers_data:
-            errors["base"] = "no_providers"
-            return self.async_show_form(
-                step_id="user",
-                data_schema=vol.Schema({}),
-                errors=errors
-            )
-
-        PROVIDERS = {key: value["api_url"] for key, value in providers_data.items()}
-        PROVIDER_NAMES = {key: value["name"] for key, value in providers_data.items()}
+        providers, provider_names, data_schema, common_translations = await load_providers(self.hass)
 
-        if not PROVIDERS:
+        if data_schema is None:
             errors["base"] = "no_providers"
             return self.async_show_form(
                 step_id="user",
@@ -52,22 +76,12 @@ class TrasMaTechElectricityConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 errors=errors
             )
 
-        default_provider = list(PROVIDERS.keys())[0]
-
-        DATA_SCHEMA = vol.Schema(
-            {
-                vol.Required(CONF_PROVIDER, default=default_provider): vol.In(PROVIDER_NAMES),
-                vol.Required(CONF_TOKEN): str,
-                vol.Required(CONF_METER_ID): vol.All(vol.Coerce(int), vol.Range(min=1)),
-            }
-        )
-
         if user_input is not None:
             provider_key = user_input[CONF_PROVIDER]
-            api_url = PROVIDERS.get(provider_key, "")
+            api_url = providers.get(provider_key, "")
 
             return self.async_create_entry(
-                title=f"TrasMaTech Electricity ({PROVIDER_NAMES.get(provider_key, 'Unknown')})",
+                title=f"TrasMaTech Electricity ({provider_names.get(provider_key, 'Unknown')})",
                 data={
                     CONF_API_URL: api_url,
                     CONF_PROVIDER: provider_key,
@@ -78,7 +92,7 @@ class TrasMaTechElectricityConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="user",
-            data_schema=DATA_SCHEMA,
+            data_schema=data_schema,
             description_placeholders={
                 "provider": common_translations.get("provider", "Provider"),
                 "token": common_translations.get("token", "API Token"),
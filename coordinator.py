@@ -0,0 +1,107 @@
+"""Data update coordinator for the TrasMaTech Electricity integration."""
+import logging
+import aiohttp
+import asyncio
+from datetime import datetime, timedelta, timezone
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.util.json import json_loads
+
+_LOGGER = logging.getLogger(__name__)
+
+SCAN_INTERVAL = timedelta(minutes=1)  # Fetches data every 1 minute
+REQUEST_TIMEOUT = 15  # Seconds before an API request is abandoned
+
+VALUE_TYPES = ("min", "max", "avg")
+PHASES = ("phaseOne", "phaseTwo", "phaseThree")
+MEASUREMENTS = ("voltage", "current")
+
+
+def _section(data, key):
+    """Return the nested dict under key, or an empty dict if it is missing or malformed."""
+    value = data.get(key)
+    return value if isinstance(value, dict) else {}
+
+
+def _round(value, divisor=None):
+    """Round a numeric value to 2 decimals, or return None for anything else."""
+    if not isinstance(value, (int, float)) or isinstance(value, bool):
+        return None
+    return round(value / divisor, 2) if divisor else round(value, 2)
+
+
+def _flatten_telemetry(data):
+    """Round and convert the telemetry once, keyed by sensor, so sensors only do a lookup.
+
+    A missing or malformed field only sets its own key to None.
+    """
+    flat = {"energy_total": _round(_section(_section(data, "cumulativeActivePower"), "input").get("max"))}
+
+    active_power_data = _section(_section(data, "activePower"), "input")
+    for value_type in VALUE_TYPES:
+        value = active_power_data.get(value_type)
+        flat[f"power_{value_type}_w"] = _round(value)
+        flat[f"power_{value_type}_kw"] = _round(value, 1000)
+
+    for phase in PHASES:
+        phase_data = _section(data, phase)
+        for measurement in MEASUREMENTS:
+            measurement_data = phase_data.get(measurement)
+            for value_type in VALUE_TYPES:
+                flat[f"{phase}_{measurement}_{value_type}"] = (
+                    _round(measurement_data.get(value_type, 0)) if isinstance(measurement_data, dict) else None
+                )
+
+    return flat
+
+
+class TrasMaTechCoordinator(DataUpdateCoordinator):
+    """Handles data retrieval from the API for all sensors."""
+
+    def __init__(self, hass, api_url, bearer_token, meter_id):
+        """Initialize the coordinator."""
+        self.meter_id = meter_id
+        self._session = async_get_clientsession(hass)  # Shared, pooled session from Home Assistant
+        self._headers = {"Authorization": f"Bearer {bearer_token}"}
+        self._url_prefix = f"{api_url}telemetry/{meter_id}/"
+        super().__init__(
+            hass,
+            _LOGGER,
+            name="TrasMaTech API",
+            update_interval=SCAN_INTERVAL,  # Ensures periodic updates
+            always_update=False,  # Skips listener updates when the data is unchanged
+        )
+
+    async def _async_update_data(self):
+        """Fetch data from the API asynchronously."""
+        try:
+            now = datetime.now(timezone.utc)
+
+            end_time = now.replace(second=0, microsecond=0) - timedelta(minutes=2)
+            start_time = end_time - timedelta(minutes=1)
+
+            start_date_str = start_time.replace(tzinfo=None).isoformat(timespec="seconds") + "Z"
+            end_date_str = end_time.replace(tzinfo=None).isoformat(timespec="seconds") + "Z"
+
+            url = f"{self._url_prefix}{start_date_str}/{end_date_str}/1"
+
+            _LOGGER.debug(f"Fetching data from API: {url}")
+
+            async with asyncio.timeout(REQUEST_TIMEOUT):
+                async with self._session.get(url, headers=self._headers) as response:
+                    if response.status != 200:
+                        raise UpdateFailed(f"API request failed: {response.status}")
+
+                    data = await response.json(loads=json_loads)
+
+            if not data or not isinstance(data, list) or len(data) == 0:
+                raise UpdateFailed("Empty or invalid API response")
+
+            return _flatten_telemetry(data[0])  # Returns the latest telemetry data
+
+        except TimeoutError as ex:
+            raise UpdateFailed("API timeout") from ex
+
+        except aiohttp.ClientError as ex:
+            _LOGGER.error(f"Error fetching data from API: {ex}")
+            raise UpdateFailed(f"API request failed: {ex}")
@@ -1,175 +1,101 @@
 import logging
-import aiohttp
-import asyncio
-from datetime import datetime, timedelta, timezone
+from itertools import product
 from homeassistant.components.sensor import SensorEntity, SensorDeviceClass, SensorStateClass
 from homeassistant.const import UnitOfPower, UnitOfEnergy, UnitOfElectricPotential, UnitOfElectricCurrent
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.exceptions import ConfigEntryNotReady
+
+from .coordinator import MEASUREMENTS, PHASES, VALUE_TYPES
 
 _LOGGER = logging.getLogger(__name__)
 
 DOMAIN = "trasmatech_electricity"
-SCAN_INTERVAL = timedelta(minutes=1)  # Fetches data every 1 minute
-
-
-class TrasMaTechCoordinator(DataUpdateCoordinator):
-    """Handles data retrieval from the API for all sensors."""
-
-    def __init__(self, hass, api_url, bearer_token, meter_id):
-        """Initialize the coordinator."""
-        self.api_url = api_url
-        self.bearer_token = bearer_token
-        self.meter_id = meter_id
-        super().__init__(
-            hass,
-            _LOGGER,
-            name="TrasMaTech API",
-            update_interval=SCAN_INTERVAL,  # Ensures periodic updates
-        )
-
-    async def _async_update_data(self):
-        """Fetch data from the API asynchronously."""
-        try:
-            now = datetime.now(timezone.utc)
+POWER_UNITS = ("W", "kW")
 
-            end_time = now.replace(second=0, microsecond=0) - timedelta(minutes=2)
-            start_time = end_time - timedelta(minutes=1)
+# 🔹 Static labels and attributes, looked up instead of recomputed per entity
+_VALUE_LABEL = {"min": "Min", "max": "Max", "avg": "Avg"}
+_PHASE_LABEL = {"phaseOne": "Phase One", "phaseTwo": "Phase Two", "phaseThree": "Phase Three"}
+_MEAS_LABEL = {"voltage": "Voltage", "current": "Current"}
+_MEAS_UNIT = {"voltage": "V", "current": "A"}
+_MEAS_ICON = {"voltage": "mdi:sine-wave", "current": "mdi:current-ac"}
+_MEAS_CLASS = {"voltage": SensorDeviceClass.VOLTAGE, "current": SensorDeviceClass.CURRENT}
 
-            start_date_str = start_time.strftime("%Y-%m-%dT%H:%M:%SZ")
-            end_date_str = end_time.strftime("%Y-%m-%dT%H:%M:%SZ")
 
-            url = f"{self.api_url}telemetry/{self.meter_id}/{start_date_str}/{end_date_str}/1"
-            headers = {"Authorization": f"Bearer {self.bearer_token}"}
+class _TrasMaTechSensor(CoordinatorEntity, SensorEntity):
+    """Base for sensors reading one pre-computed value from the coordinator data."""
 
-            _LOGGER.debug(f"Fetching data from API: {url}")
+    def __init__(self, coordinator, key):
+        super().__init__(coordinator)
+        self._key = key
+        self._update_native_value()
 
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers) as response:
-                    if response.status != 200:
-                        raise UpdateFailed(f"API request failed: {response.status}")
-
-                    data = await response.json()
-
-            if not data or not isinstance(data, list) or len(data) == 0:
-                raise UpdateFailed("Empty or invalid API response")
-
-            return data[0]  # Returns the latest telemetry data
+    def _update_native_value(self):
+        """Read the pre-computed value from the coordinator data."""
+        data = self.coordinator.data
+        self._attr_native_value = data.get(self._key) if data else None
 
-        except aiohttp.ClientError as ex:
-            _LOGGER.error(f"Error fetching data from API: {ex}")
-            raise UpdateFailed(f"API request failed: {ex}")
+    @callback
+    def _handle_coordinator_update(self):
+        """Store the new value once per coordinator update."""
+        self._update_native_value()
+        self.async_write_ha_state()
 
 
-class TrasMaTechTotalUsageSensor(SensorEntity):
+class TrasMaTechTotalUsageSensor(_TrasMaTechSensor):
     """Sensor for total energy consumption (kWh) based on cumulativeActivePower.max."""
 
-    def __init__(self, coordinator, meter_id):
-        self.coordinator = coordinator
-        self._meter_id = meter_id
-        self._attr_unique_id = f"electricity_meter_{meter_id}_energy_total_usage"
-        self.entity_id = f"sensor.electricity_meter_{meter_id}_energy_total_usage"
+    def __init__(self, coordinator, prefix, name_prefix):
+        super().__init__(coordinator, "energy_total")
+        self._attr_unique_id = f"{prefix}_energy_total_usage"
+        self.entity_id = f"sensor.{self._attr_unique_id}"
         self._attr_device_class = SensorDeviceClass.ENERGY
         self._attr_state_class = SensorStateClass.TOTAL_INCREASING
         self._attr_native_unit_of_measurement = "kWh"
         self._attr_last_reset = None
-        self._attr_name = f"Electricity Meter {meter_id} - All Time Total Energy Usage"
+        self._attr_name = f"{name_prefix} - All Time Total Energy Usage"
 
-    @property
-    def state(self):
-        """Retrieve the value from the coordinator."""
-        data = self.coordinator.data
-        if data and "cumulativeActivePower" in data:
-            return round(data["cumulativeActivePower"]["input"]["max"], 2)
-        return None
 
-
-class TrasMaTechPowerSensor(SensorEntity):
+class TrasMaTechPowerSensor(_TrasMaTechSensor):
     """Sensor for real-time power measurements in W and kW."""
 
-    def __init__(self, coordinator, meter_id, sensor_type, unit):
-        self.coordinator = coordinator
-        self._meter_id = meter_id
-        self._sensor_type = sensor_type
-        self._unit = unit
-        self._attr_unique_id = f"electricity_meter_{meter_id}_power_{sensor_type}_{unit.lower()}"
-        self.entity_id = f"sensor.electricity_meter_{meter_id}_power_{sensor_type}_{unit.lower()}"
+    def __init__(self, coordinator, prefix, name_prefix, sensor_type, unit):
+        super().__init__(coordinator, f"power_{sensor_type}_{unit.lower()}")
+        self._attr_unique_id = f"{prefix}_{self._key}"
+        self.entity_id = f"sensor.{self._attr_unique_id}"
         self._attr_device_class = SensorDeviceClass.POWER
         self._attr_state_class = SensorStateClass.MEASUREMENT
         self._attr_native_unit_of_measurement = unit
-        self._attr_name = f"Electricity Meter {meter_id} - Power {sensor_type.capitalize()} ({unit})"
-
-    @property
-    def state(self):
-        """Retrieve real-time power data from the coordinator."""
-        data = self.coordinator.data
-        if data and "activePower" in data:
-            active_power_data = data["activePower"]["input"]
-            if active_power_data:
-                value = active_power_data.get(self._sensor_type, None)
-                if value is not None:
-                    return round(value / 1000, 2) if self._unit == "kW" else round(value, 2)
-        return None
+        self._attr_name = f"{name_prefix} - Power {_VALUE_LABEL[sensor_type]} ({unit})"
 
 
-class TrasMaTechPhaseSensor(SensorEntity):
+class TrasMaTechPhaseSensor(_TrasMaTechSensor):
     """Sensor for voltage (V) and current (A) per phase."""
 
-    def __init__(self, coordinator, meter_id, phase, measurement, value_type):
-        self.coordinator = coordinator
-        self._meter_id = meter_id
-        self._phase = phase
-        self._measurement = measurement
-        self._value_type = value_type
+    def __init__(self, coordinator, prefix, name_prefix, phase, measurement, value_type):
+        super().__init__(coordinator, f"{phase}_{measurement}_{value_type}")
 
-        unit = "V" if measurement == "voltage" else "A"
-        icon = "mdi:sine-wave" if measurement == "voltage" else "mdi:current-ac"
-
-        self._attr_device_class = SensorDeviceClass.VOLTAGE if measurement == "voltage" else SensorDeviceClass.CURRENT
+        self._attr_device_class = _MEAS_CLASS[measurement]
         self._attr_state_class = SensorStateClass.MEASUREMENT
-        self._attr_native_unit_of_measurement = unit
-        self._attr_icon = icon
-        self._attr_name = f"Electricity Meter {meter_id} - {phase.replace('phase', 'Phase ')} {measurement.capitalize()} {value_type.capitalize()}"
+        self._attr_native_unit_of_measurement = _MEAS_UNIT[measurement]
+        self._attr_icon = _MEAS_ICON[measurement]
+        self._attr_name = f"{name_prefix} - {_PHASE_LABEL[phase]} {_MEAS_LABEL[measurement]} {_VALUE_LABEL[value_type]}"
 
-        self._attr_unique_id = f"electricity_meter_{meter_id}_{phase}_{measurement}_{value_type}"
-        self.entity_id = f"sensor.electricity_meter_{meter_id}_{phase}_{measurement}_{value_type}"
-
-    @property
-    def state(self):
-        """Retrieve value from the coordinator."""
-        data = self.coordinator.data
-        if data and self._phase in data and self._measurement in data[self._phase]:
-            return round(data[self._phase][self._measurement].get(self._value_type, 0), 2)
-        return None
+        self._attr_unique_id = f"{prefix}_{self._key}"
+        self.entity_id = f"sensor.{self._attr_unique_id}"
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback):
     """Set up TrasMaTech Electricity sensors from the configuration entry."""
-    api_url = entry.data.get("api_url")
-    bearer_token = entry.data.get("token")
-    meter_id = entry.data.get("meter_id")
-
-    coordinator = TrasMaTechCoordinator(hass, api_url, bearer_token, meter_id)
-
-    try:
-        await coordinator.async_config_entry_first_refresh()
-    except UpdateFailed as e:
-        _LOGGER.error("API request failed: %s", e)
-        raise ConfigEntryNotReady from e  # Ensures Home Assistant retries later
+    coordinator = entry.runtime_data
 
-    # 🔹 Ensure Home Assistant continues to refresh periodically
-    entry.async_on_unload(coordinator.async_add_listener(lambda: None))
+    # 🔹 Formatted once per meter and shared by all of its sensors
+    prefix = f"electricity_meter_{coordinator.meter_id}"
+    name_prefix = f"Electricity Meter {coordinator.meter_id}"
 
     async_add_entities([
-        TrasMaTechTotalUsageSensor(coordinator, meter_id),
-        TrasMaTechPowerSensor(coordinator, meter_id, "min", "W"),
-        TrasMaTechPowerSensor(coordinator, meter_id, "max", "W"),
-        TrasMaTechPowerSensor(coordinator, meter_id, "avg", "W"),
-        TrasMaTechPowerSensor(coordinator, meter_id, "min", "kW"),
-        TrasMaTechPowerSensor(coordinator, meter_id, "max", "kW"),
-        TrasMaTechPowerSensor(coordinator, meter_id, "avg", "kW"),
-        *[TrasMaTechPhaseSensor(coordinator, meter_id, phase, meas, val) for phase in ["phaseOne", "phaseTwo", "phaseThree"] for meas in ["voltage", "current"] for val in ["min", "max", "avg"]],
-    ], True)
+        TrasMaTechTotalUsageSensor(coordinator, prefix, name_prefix),
+        *[TrasMaTechPowerSensor(coordinator, prefix, name_prefix, val, unit) for unit, val in product(POWER_UNITS, VALUE_TYPES)],
+        *[TrasMaTechPhaseSensor(coordinator, prefix, name_prefix, phase, meas, val) for phase, meas, val in product(PHASES, MEASUREMENTS, VALUE_TYPES)],
+    ])  # Values are seeded from the first refresh, so no update before adding